@@ -13,14 +13,49 @@
 #  limitations under the License.
 
 import asyncio
+import functools
 import json
 import ipaddress
+import re
+import socket
 import warnings
 import logging
-from typing import Union
+from typing import Tuple, Union
 
 from pyasic.errors import APIError, APIWarning
 
+# orjson parses the raw bytes from the miner directly and is much faster than the
+# standard library, but it is not required, so fall back to json if its missing
+try:
+    import orjson as _json
+
+    _json_dumps = _json.dumps
+except ImportError:
+    _json = json
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+
+# commands made of these characters can be formatted directly, without escaping
+_SIMPLE_COMMAND_RE = re.compile(r"[A-Za-z0-9_+]+")
+_SIMPLE_COMMAND_TEMPLATE = b'{"command": "%s"}'
+
+# fixes for broken json returned by some miners, matched in one pass over the data
+# the lookaheads keep fixes that share a bracket, such as `,}{`, from overlapping
+_API_DATA_FIXES = {
+    # btminer returns an extra comma, `,}`
+    b",": b"",
+    # bmminer returns without a specific comma, `}{`
+    b"}": b"},",
+    # bmminer returns with a specific comma, `[,{`
+    b"[,": b"[",
+    # avalonminers return inf and nan
+    b"inf": b"0",
+    b"nan": b"0",
+}
+_API_DATA_FIX_RE = re.compile(rb",(?=\})|\}(?=\{)|\[,(?=\{)|\binf\b|\bnan\b")
+
 
 class BaseMinerAPI:
     def __init__(self, ip: str, port: int = 4028) -> None:
@@ -28,6 +63,16 @@ class BaseMinerAPI:
         self.port = port
         # ip address of the miner
         self.ip = ipaddress.ip_address(ip)
+        # string form of the ip, used to open connections without reformatting each time
+        self._ip_str = str(self.ip)
+        # whether to keep the connection open between commands, for miners that allow it
+        self.keepalive = False
+        # how long to wait for a reply on a kept open connection before sending on a new one
+        self.keepalive_timeout = 5
+        self._reader = None
+        self._writer = None
+        self._conn_loop = None
+        self._conn_lock = None
 
     def __new__(cls, *args, **kwargs):
         if cls is BaseMinerAPI:
@@ -40,88 +85,217 @@ class BaseMinerAPI:
         Returns:
             A list of all API commands that the miner supports.
         """
-        return [
-            func
-            for func in
-            # each function in self
-            dir(self)
-            if callable(getattr(self, func)) and
-            # no __ or _ methods
-            not func.startswith("__") and not func.startswith("_") and
-            # remove all functions that are in this base class
-            func
-            not in [
+        return list(self._get_commands())
+
+    @classmethod
+    def _get_commands(cls) -> tuple:
+        # the commands are the same for every instance of a class, so only find them once
+        if "_commands" not in cls.__dict__:
+            cls._commands = tuple(
                 func
-                for func in dir(BaseMinerAPI)
-                if callable(getattr(BaseMinerAPI, func))
-            ]
-        ]
+                for func in
+                # each function in the class
+                dir(cls)
+                # no __ or _ methods
+                if not func.startswith("_") and
+                # remove all functions that are in this base class
+                func not in _BASE_METHODS and callable(getattr(cls, func))
+            )
+            cls._commands_set = frozenset(cls._commands)
+        return cls._commands
 
-    def _check_commands(self, *commands):
-        allowed_commands = self.get_commands()
-        return_commands = []
-        for command in [*commands]:
-            if command in allowed_commands:
-                return_commands.append(command)
-            else:
-                warnings.warn(
-                    f"""Removing incorrect command: {command}
+    @classmethod
+    def _check_commands(cls, *commands):
+        cls._get_commands()
+        allowed_commands = cls._commands_set
+        return_commands = [
+            command for command in commands if command in allowed_commands
+        ]
+        # only go back through the commands to warn if something was removed
+        if len(return_commands) != len(commands):
+            for command in commands:
+                if command not in allowed_commands:
+                    warnings.warn(
+                        f"""Removing incorrect command: {command}
 If you are sure you want to use this command please use API.send_command("{command}", ignore_errors=True) instead.""",
-                    APIWarning,
-                )
+                        APIWarning,
+                    )
         return return_commands
 
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_multicommand(cls, commands: tuple) -> str:
+        # the same commands are sent over and over when polling, so save the result
+        # make sure we can actually run each command, otherwise they will fail
+        return "+".join(cls._check_commands(*commands))
+
     async def multicommand(self, *commands: str) -> dict:
         """Creates and sends multiple commands as one command to the miner.
 
         Parameters:
             *commands: The commands to send as a multicommand to the miner.
         """
-        logging.debug(f"{self.ip}: Sending multicommand: {[*commands]}")
-        # make sure we can actually run each command, otherwise they will fail
-        commands = self._check_commands(*commands)
+        logging.debug(f"{self._ip_str}: Sending multicommand: {[*commands]}")
         # standard multicommand format is "command1+command2"
         # doesnt work for S19 which uses the backup _x19_multicommand
-        command = "+".join(commands)
+        command = self._build_multicommand(commands)
         try:
             data = await self.send_command(command)
         except APIError:
             return {}
-        logging.debug(f"{self.ip}: Received multicommand data.")
+        logging.debug(f"{self._ip_str}: Received multicommand data.")
         return data
 
     async def _send_bytes(self, data: bytes) -> bytes:
+        if self.keepalive:
+            return await self._send_bytes_keepalive(data)
+        streams = await self._open_connection()
+        if not streams:
+            return b"{}"
+        reader, writer = streams
+
+        return await self._send_and_receive(reader, writer, data, self._ip_str)
+
+    async def _open_connection(
+        self,
+    ) -> Union[Tuple[asyncio.StreamReader, asyncio.StreamWriter], None]:
         try:
             # get reader and writer streams
-            reader, writer = await asyncio.open_connection(str(self.ip), self.port)
+            return await asyncio.open_connection(self._ip_str, self.port)
         # handle OSError 121
         except OSError as e:
-            if e.winerror == "121":
+            if getattr(e, "winerror", None) == 121:
                 logging.warning("Semaphore Timeout has Expired.")
-            return b"{}"
+            return None
+
+    async def _send_bytes_keepalive(self, data: bytes) -> bytes:
+        loop = asyncio.get_running_loop()
+        if self._conn_loop is not loop:
+            # streams or a lock from an earlier event loop can't be used on this one
+            self._drop_connection()
+            self._conn_lock = asyncio.Lock()
+            self._conn_loop = loop
+        async with self._conn_lock:
+            # the miner may have closed a reused connection, so allow one reconnect
+            for _ in range(2):
+                reused = self._writer is not None
+                if not reused:
+                    streams = await self._open_connection()
+                    if not streams:
+                        return b"{}"
+                    self._reader, self._writer = streams
+                    sock = self._writer.get_extra_info("socket")
+                    if sock is not None:
+                        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                ret_data = b""
+                try:
+                    ret_data = await self._send_and_receive(
+                        self._reader,
+                        self._writer,
+                        data,
+                        self._ip_str,
+                        keep_open=True,
+                        timeout=self.keepalive_timeout,
+                    )
+                except ConnectionError:
+                    pass
+                except asyncio.TimeoutError:
+                    # the rest of the reply could still arrive, and be read as the next reply
+                    # so drop the connection and wait for the reply on one of its own instead
+                    self._drop_connection()
+                    logging.warning(
+                        f"{self._ip_str}: API reply timed out, resending on a new connection."
+                    )
+                    streams = await self._open_connection()
+                    if not streams:
+                        return b"{}"
+                    reader, writer = streams
+                    return await self._send_and_receive(
+                        reader, writer, data, self._ip_str
+                    )
+                except BaseException:
+                    # cancelled partway through, so the reply may still be waiting to be read
+                    self._drop_connection()
+                    raise
+                # only reuse the connection if the whole reply was read from it
+                # cgminer and most others close the connection after each reply
+                if self._writer.is_closing() or not ret_data.endswith(b"\x00"):
+                    self._drop_connection()
+                if ret_data or not reused:
+                    break
+            return ret_data
+
+    def _drop_connection(self) -> None:
+        if self._writer:
+            try:
+                self._writer.close()
+            except RuntimeError:
+                # the event loop the connection was made on has already closed
+                pass
+        self._reader, self._writer = None, None
+
+    async def close(self) -> None:
+        """Close the connection to the miner if it is being kept open."""
+        writer = self._writer
+        self._drop_connection()
+        if writer and self._conn_loop is asyncio.get_running_loop():
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    async def _send_and_receive(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        data: bytes,
+        ip: str,
+        keep_open: bool = False,
+        timeout: float = None,
+        log_level: int = logging.WARNING,
+    ) -> bytes:
+        # disable Nagle's algorithm so the small command is sent immediately
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
         # send the command
         writer.write(data)
         await writer.drain()
 
         # instantiate data
-        ret_data = b""
+        ret_data = bytearray()
+        # bind the methods used in the loop once, instead of looking them up for every chunk
+        read = reader.read
+        extend = ret_data.extend
 
         # loop to receive all the data
         try:
             while True:
-                d = await reader.read(4096)
+                if keep_open:
+                    # a reply that never gets its null byte would otherwise wait forever
+                    d = await asyncio.wait_for(read(65536), timeout=timeout)
+                else:
+                    d = await read(65536)
                 if not d:
                     break
-                ret_data += d
+                extend(d)
+                # on an open connection the trailing null byte is the only sign the reply is done
+                if keep_open and d.endswith(b"\x00"):
+                    break
+        except asyncio.TimeoutError:
+            # left to the caller, which knows what to do with the open connection
+            raise
         except Exception as e:
-            logging.warning(f"{self.ip}: API Command Error: - {e}")
+            logging.log(log_level, f"{ip}: API Command Error: - {e}")
+            keep_open = False
 
-        # close the connection
-        writer.close()
-        await writer.wait_closed()
+        # close the connection, unless it is being kept open and the miner left it open
+        if not keep_open or reader.at_eof():
+            writer.close()
+            await writer.wait_closed()
 
-        return ret_data
+        return bytes(ret_data)
 
     async def send_command(
         self,
@@ -141,13 +315,8 @@ If you are sure you want to use this command please use API.send_command("{comma
         Returns:
             The return data from the API command parsed from JSON into a dict.
         """
-        # create the command
-        cmd = {"command": command}
-        if parameters:
-            cmd["parameter"] = parameters
-
         # send the command
-        data = await self._send_bytes(json.dumps(cmd).encode("utf-8"))
+        data = await self._send_bytes(self._create_command(command, parameters))
 
         data = self._load_api_data(data)
 
@@ -158,12 +327,29 @@ If you are sure you want to use this command please use API.send_command("{comma
             if not validation[0]:
                 if not x19_command:
                     logging.warning(
-                        f"{self.ip}: API Command Error: {command}: {validation[1]}"
+                        f"{self._ip_str}: API Command Error: {command}: {validation[1]}"
                     )
                 raise APIError(validation[1])
 
         return data
 
+    @staticmethod
+    def _create_command(
+        command: Union[str, bytes], parameters: Union[str, int, bool] = None
+    ) -> bytes:
+        # most commands are a plain name, so skip the json encoder for those
+        if (
+            not parameters
+            and isinstance(command, str)
+            and _SIMPLE_COMMAND_RE.fullmatch(command)
+        ):
+            return _SIMPLE_COMMAND_TEMPLATE % command.encode("utf-8")
+        # create the command
+        cmd = {"command": command}
+        if parameters:
+            cmd["parameter"] = parameters
+        return _json_dumps(cmd)
+
     async def send_privileged_command(self, *args, **kwargs) -> dict:
         return await self.send_command(*args, **kwargs)
 
@@ -171,61 +357,53 @@ If you are sure you want to use this command please use API.send_command("{comma
     def _validate_command_output(data: dict) -> tuple:
         # check if the data returned is correct or an error
         # if status isn't a key, it is a multicommand
-        if "STATUS" not in data.keys():
-            for key in data.keys():
+        if "STATUS" not in data:
+            for key, entries in data.items():
                 # make sure not to try to turn id into a dict
-                if not key == "id":
-                    # make sure they succeeded
-                    if "STATUS" in data[key][0].keys():
-                        if data[key][0]["STATUS"][0]["STATUS"] not in ["S", "I"]:
-                            # this is an error
-                            return False, f"{key}: " + data[key][0]["STATUS"][0]["Msg"]
-        elif "id" not in data.keys():
-            if data["STATUS"] not in ["S", "I"]:
+                if key == "id":
+                    continue
+                # make sure they succeeded
+                status = entries[0].get("STATUS")
+                if status and status[0].get("STATUS") not in ("S", "I"):
+                    # this is an error
+                    return False, f"{key}: " + status[0]["Msg"]
+            return True, None
+
+        status = data["STATUS"]
+        if "id" not in data:
+            if status not in ("S", "I"):
                 return False, data["Msg"]
-        else:
-            # make sure the command succeeded
-            if type(data["STATUS"]) == str:
-                if data["STATUS"] in ["RESTART"]:
-                    return True, None
-            elif data["STATUS"][0]["STATUS"] not in ("S", "I"):
-                # this is an error
-                if data["STATUS"][0]["STATUS"] not in ("S", "I"):
-                    return False, data["STATUS"][0]["Msg"]
+        # string statuses with an id, such as "RESTART", are not errors
+        elif not isinstance(status, str) and status[0]["STATUS"] not in ("S", "I"):
+            # this is an error
+            return False, status[0]["Msg"]
         return True, None
 
     @staticmethod
     def _load_api_data(data: bytes) -> dict:
-        str_data = None
         # some json from the API returns with a null byte (\x00) on the end
-        if data.endswith(b"\x00"):
-            # handle the null byte
-            str_data = data.decode("utf-8")[:-1]
-        else:
-            # no null byte
-            str_data = data.decode("utf-8")
-        # fix an error with a btminer return having an extra comma that breaks json.loads()
-        str_data = str_data.replace(",}", "}")
+        data = data.rstrip(b"\x00")
         # fix an error with a btminer return having a newline that breaks json.loads()
-        str_data = str_data.replace("\n", "")
-        # fix an error with a bmminer return not having a specific comma that breaks json.loads()
-        str_data = str_data.replace("}{", "},{")
-        # fix an error with a bmminer return having a specific comma that breaks json.loads()
-        str_data = str_data.replace("[,{", "[{")
-        # fix an error with Avalonminers returning inf and nan
-        str_data = str_data.replace("inf", "0")
-        str_data = str_data.replace("nan", "0")
+        data = data.replace(b"\n", b"")
+        # fix the rest of the errors from btminer, bmminer, and avalonminers that break json.loads()
+        data = _API_DATA_FIX_RE.sub(lambda m: _API_DATA_FIXES[m.group()], data)
         # fix whatever this garbage from avalonminers is `,"id":1}`
-        if str_data.startswith(","):
-            str_data = f"{{{str_data[1:]}"
+        if data.startswith(b","):
+            data = b"{" + data[1:]
         # try to fix an error with overflowing the receive buffer
         # this can happen in cases such as bugged btminers returning arbitrary length error info with 100s of errors.
-        if not str_data.endswith("}"):
-            str_data = ",".join(str_data.split(",")[:-1]) + "}"
+        if not data.endswith(b"}"):
+            data = b",".join(data.split(b",")[:-1]) + b"}"
 
         # parse the json
         try:
-            parsed_data = json.loads(str_data)
+            parsed_data = _json.loads(data)
         except json.decoder.JSONDecodeError as e:
-            raise APIError(f"Decode Error {e}: {str_data}")
+            raise APIError(f"Decode Error {e}: {data.decode('utf-8', 'replace')}")
         return parsed_data
+
+
+# methods of the base class, which are never API commands
+_BASE_METHODS = frozenset(
+    func for func in dir(BaseMinerAPI) if callable(getattr(BaseMinerAPI, func))
+)
@@ -41,18 +41,16 @@ class BMMinerAPI(BaseMinerAPI):
     async def multicommand(
         self, *commands: str, ignore_x19_error: bool = False
     ) -> dict:
-        logging.debug(f"{self.ip}: Sending multicommand: {[*commands]}")
-        # make sure we can actually run each command, otherwise they will fail
-        commands = self._check_commands(*commands)
+        logging.debug(f"{self._ip_str}: Sending multicommand: {[*commands]}")
         # standard multicommand format is "command1+command2"
         # doesnt work for S19 which uses the backup _x19_multicommand
-        command = "+".join(commands)
+        command = self._build_multicommand(commands)
         try:
             data = await self.send_command(command, x19_command=ignore_x19_error)
         except APIError:
-            logging.debug(f"{self.ip}: Handling X19 multicommand.")
+            logging.debug(f"{self._ip_str}: Handling X19 multicommand.")
             data = await self._x19_multicommand(*command.split("+"))
-        logging.debug(f"{self.ip}: Received multicommand data.")
+        logging.debug(f"{self._ip_str}: Received multicommand data.")
         return data
 
     async def _x19_multicommand(self, *commands):
@@ -66,7 +64,7 @@ class BMMinerAPI(BaseMinerAPI):
         except APIError as e:
             raise APIError(e)
         except Exception as e:
-            logging.warning(f"{self.ip}: API Multicommand Error: {e}")
+            logging.warning(f"{self._ip_str}: API Multicommand Error: {e}")
         return data
 
     async def version(self) -> dict:
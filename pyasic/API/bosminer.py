@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 from pyasic.API import BaseMinerAPI
+from pyasic.misc import async_ttl_cache
 
 
 class BOSMinerAPI(BaseMinerAPI):
@@ -61,11 +62,15 @@ class BOSMinerAPI(BaseMinerAPI):
         """
         return await self.send_command("asc", parameters=n)
 
+    # static details don't change between calls, so save repeat round trips
+    @async_ttl_cache(seconds=5)
     async def devdetails(self) -> dict:
         """Get data on all devices with their static details.
         <details>
             <summary>Expand</summary>
 
+        Results are cached for 5 seconds.
+
         Returns:
             Data on all devices with their static details.
         </details>
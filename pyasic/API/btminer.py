@@ -204,7 +204,7 @@ class BTMinerAPI(BaseMinerAPI):
         try:
             data = parse_btminer_priviledge_data(self.current_token, data)
         except Exception as e:
-            logging.info(f"{str(self.ip)}: {e}")
+            logging.info(f"{self._ip_str}: {e}")
 
         if not ignore_errors:
             # if it fails to validate, it is likely an error
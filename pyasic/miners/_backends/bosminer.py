@@ -12,12 +12,20 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+import contextlib
 import ipaddress
 import logging
 import json
 from typing import Union, List
 
-import toml
+import asyncssh
+
+# tomllib is only in the standard library from python 3.11, and is faster than toml
+try:
+    from tomllib import loads as toml_loads
+except ImportError:
+    from toml import loads as toml_loads
 
 
 from pyasic.miners.base import BaseMiner
@@ -32,6 +40,22 @@ from pyasic.config import MinerConfig
 from pyasic.settings import PyasicSettings
 
 
+class _BOSMinerSSHClient(asyncssh.SSHClient):
+    """Drops the cached ssh connection of a BOSMiner when the connection is lost."""
+
+    def __init__(self, miner: "BOSMiner") -> None:
+        self.miner = miner
+        self.conn = None
+
+    def connection_made(self, conn: asyncssh.SSHClientConnection) -> None:
+        self.conn = conn
+
+    def connection_lost(self, exc: Union[Exception, None]) -> None:
+        # only clear the cache if it still holds this connection
+        if self.miner._ssh_conn is self.conn:
+            self.miner._ssh_conn = None
+
+
 class BOSMiner(BaseMiner):
     def __init__(self, ip: str) -> None:
         super().__init__(ip)
@@ -41,6 +65,61 @@ class BOSMiner(BaseMiner):
         self.uname = "root"
         self.pwd = "admin"
         self.config = None
+        # keep the ssh connection open between commands, until `self.close()` is called
+        self.ssh_keepalive = False
+        self._ssh_conn = None
+        self._ssh_loop = None
+        self._ssh_lock = None
+
+    async def _get_ssh_connection(self) -> asyncssh.connect:
+        """Get an ssh connection to the miner, reusing the open one if `self.ssh_keepalive` is set."""
+        if not self.ssh_keepalive:
+            return await super()._get_ssh_connection()
+
+        loop = asyncio.get_running_loop()
+        if self._ssh_loop is not loop:
+            # a connection or lock from an earlier event loop can't be used on this one
+            self._ssh_conn = None
+            self._ssh_lock = asyncio.Lock()
+            self._ssh_loop = loop
+        async with self._ssh_lock:
+            if not self._ssh_conn:
+                self._ssh_conn = await super()._get_ssh_connection(
+                    client_factory=lambda: _BOSMinerSSHClient(self)
+                )
+        return self._ssh_conn
+
+    @contextlib.asynccontextmanager
+    async def _ssh_connection(self):
+        """Use an ssh connection to the miner, closing it afterwards unless it is being kept open."""
+        conn = await self._get_ssh_connection()
+        try:
+            yield conn
+        except BaseException:
+            # the connection may have gone stale, so reconnect on the next command
+            await self._close_ssh_connection(conn)
+            raise
+        if conn is not self._ssh_conn:
+            await self._close_ssh_connection(conn)
+
+    async def close(self) -> None:
+        """Close the ssh connection and any API connection kept open to the miner."""
+        await self._close_ssh_connection()
+        await self.api.close()
+
+    async def _close_ssh_connection(
+        self, conn: asyncssh.SSHClientConnection = None
+    ) -> None:
+        """Close an ssh connection to the miner, by default the one being kept open."""
+        if conn is None or conn is self._ssh_conn:
+            conn, self._ssh_conn = self._ssh_conn, None
+        if conn:
+            try:
+                conn.close()
+                await conn.wait_closed()
+            except Exception:
+                # a connection left over from a closed event loop can't be closed cleanly
+                pass
 
     async def send_ssh_command(self, cmd: str) -> Union[str, None]:
         """Send a command to the miner over ssh.
@@ -50,22 +129,23 @@ class BOSMiner(BaseMiner):
         """
         result = None
 
-        # open an ssh connection
-        async with (await self._get_ssh_connection()) as conn:
-            # 3 retries
-            for i in range(3):
-                try:
+        # 3 retries
+        for i in range(3):
+            try:
+                # get the ssh connection, reconnecting if the last attempt dropped it
+                async with self._ssh_connection() as conn:
                     # run the command and get the result
                     result = await conn.run(cmd)
                     result = result.stdout
-                except Exception as e:
-                    # if the command fails, log it
-                    logging.warning(f"{self} command {cmd} error: {e}")
-
-                    # on the 3rd retry, return None
-                    if i == 3:
-                        return
-                    continue
+            except Exception as e:
+                # if the command or the connection fails, log it
+                logging.warning(f"{self} command {cmd} error: {e}")
+
+                # on the 3rd retry, return None
+                if i == 2:
+                    return
+                continue
+            break
         # return the result, either command output or None
         return str(result)
 
@@ -122,6 +202,8 @@ class BOSMiner(BaseMiner):
         logging.debug(f"{self}: Sending reboot command.")
         _ret = await self.send_ssh_command("/sbin/reboot")
         logging.debug(f"{self}: Reboot command completed.")
+        # the miner is going down, so don't try to reuse this connection
+        await self._close_ssh_connection()
         if isinstance(_ret, str):
             return True
         return False
@@ -133,12 +215,12 @@ class BOSMiner(BaseMiner):
             The config from `self.config`.
         """
         logging.debug(f"{self}: Getting config.")
-        async with (await self._get_ssh_connection()) as conn:
+        async with self._ssh_connection() as conn:
             logging.debug(f"{self}: Opening SFTP connection.")
             async with conn.start_sftp_client() as sftp:
                 logging.debug(f"{self}: Reading config file.")
                 async with sftp.open("/etc/bosminer.toml") as file:
-                    toml_data = toml.loads(await file.read())
+                    toml_data = toml_loads(await file.read())
         logging.debug(f"{self}: Converting config file.")
         cfg = MinerConfig().from_raw(toml_data)
         self.config = cfg
@@ -153,7 +235,7 @@ class BOSMiner(BaseMiner):
         if self.hostname:
             return self.hostname
         try:
-            async with (await self._get_ssh_connection()) as conn:
+            async with self._ssh_connection() as conn:
                 if conn is not None:
                     data = await conn.run("cat /proc/sys/kernel/hostname")
                     host = data.stdout.strip()
@@ -235,10 +317,13 @@ class BOSMiner(BaseMiner):
         toml_conf = config.as_bos(
             model=self.model.replace(" (BOS)", ""), user_suffix=user_suffix
         )
-        async with (await self._get_ssh_connection()) as conn:
-            await conn.run("/etc/init.d/bosminer stop")
+        async with self._ssh_connection() as conn:
             logging.debug(f"{self}: Opening SFTP connection.")
-            async with conn.start_sftp_client() as sftp:
+            # open the sftp session while bosminer stops instead of waiting for it
+            _, sftp = await asyncio.gather(
+                conn.run("/etc/init.d/bosminer stop"), conn.start_sftp_client()
+            )
+            async with sftp:
                 logging.debug(f"{self}: Opening config file.")
                 async with sftp.open("/etc/bosminer.toml", "w+") as file:
                     await file.write(toml_conf)
@@ -248,11 +333,9 @@ class BOSMiner(BaseMiner):
     async def check_light(self) -> bool:
         if self.light:
             return self.light
-        data = (
-            await self.send_ssh_command("cat /sys/class/leds/'Red LED'/delay_off")
-        ).strip()
+        data = await self.send_ssh_command("cat /sys/class/leds/'Red LED'/delay_off")
         self.light = False
-        if data == "50":
+        if data and data.strip() == "50":
             self.light = True
         return self.light
 
@@ -486,4 +569,5 @@ class BOSMiner(BaseMiner):
 
     async def get_mac(self):
         result = await self.send_ssh_command("cat /sys/class/net/eth0/address")
-        return result.upper().strip()
+        if result:
+            return result.upper().strip()
@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class T17e(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "T17e"
-        self.nominal_chips = 78
-        self.fan_count = 4
+    model = "T17e"
+    nominal_chips = 78
+    fan_count = 4
@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class S19XP(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "S19 XP"
-        self.nominal_chips = 110
-        self.fan_count = 4
+    model = "S19 XP"
+    nominal_chips = 110
+    fan_count = 4
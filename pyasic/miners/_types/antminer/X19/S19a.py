@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class S19a(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "S19a"
-        self.nominal_chips = 72
-        self.fan_count = 4
+    model = "S19a"
+    nominal_chips = 72
+    fan_count = 4
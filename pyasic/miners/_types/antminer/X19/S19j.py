@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class S19j(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "S19j"
-        self.nominal_chips = 114
-        self.fan_count = 4
+    model = "S19j"
+    nominal_chips = 114
+    fan_count = 4
@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class T19(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "T19"
-        self.nominal_chips = 76
-        self.fan_count = 4
+    model = "T19"
+    nominal_chips = 76
+    fan_count = 4
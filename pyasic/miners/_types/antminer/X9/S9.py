@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class S9(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "S9"
-        self.nominal_chips = 63
-        self.fan_count = 2
+    model = "S9"
+    nominal_chips = 63
+    fan_count = 2
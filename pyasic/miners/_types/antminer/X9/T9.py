@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class T9(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "T9"
-        self.nominal_chips = 54
-        self.fan_count = 2
+    model = "T9"
+    nominal_chips = 54
+    fan_count = 2
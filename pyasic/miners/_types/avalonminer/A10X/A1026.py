@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class Avalon1026(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "Avalon 1026"
-        self.nominal_chips = 80
-        self.fan_count = 2
+    model = "Avalon 1026"
+    nominal_chips = 80
+    fan_count = 2
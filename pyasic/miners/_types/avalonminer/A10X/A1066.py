@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class Avalon1066(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "Avalon 1066"
-        self.nominal_chips = 114
-        self.fan_count = 4
+    model = "Avalon 1066"
+    nominal_chips = 114
+    fan_count = 4
@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class Avalon841(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "Avalon 841"
-        self.chip_count = 26  # This miner has 4 boards totaling 104
-        self.fan_count = 1  # also only 1 fan
+    model = "Avalon 841"
+    chip_count = 26  # This miner has 4 boards totaling 104
+    fan_count = 1  # also only 1 fan
@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class InnosiliconT3HPlus(BaseMiner):
-    def __init__(self, ip: str) -> None:
-        super().__init__()
-        self.ip = ip
-        self.model = "T3H+"
-        self.nominal_chips = 114
-        self.fan_count = 4
+    model = "T3H+"
+    nominal_chips = 114
+    fan_count = 4
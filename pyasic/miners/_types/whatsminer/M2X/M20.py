@@ -16,18 +16,12 @@ from pyasic.miners.base import BaseMiner
 
 
 class M20(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M20"
-        self.nominal_chips = 70
-        self.fan_count = 2
+    model = "M20"
+    nominal_chips = 70
+    fan_count = 2
 
 
 class M20V10(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M20 V10"
-        self.nominal_chips = 70
-        self.fan_count = 2
+    model = "M20 V10"
+    nominal_chips = 70
+    fan_count = 2
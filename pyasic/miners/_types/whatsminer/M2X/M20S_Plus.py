@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class M20SPlus(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M20S+"
-        self.nominal_chips = 66
-        self.fan_count = 2
+    model = "M20S+"
+    nominal_chips = 66
+    fan_count = 2
@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class M21SPlus(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M21S+"
-        self.nominal_chips = 105
-        self.fan_count = 2
+    model = "M21S+"
+    nominal_chips = 105
+    fan_count = 2
@@ -16,36 +16,24 @@ from pyasic.miners.base import BaseMiner
 
 
 class M30SPlusPlus(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M30S++"
-        self.nominal_chips = 111
-        self.fan_count = 2
+    model = "M30S++"
+    nominal_chips = 111
+    fan_count = 2
 
 
 class M30SPlusPlusVG30(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M30S++ VG30"
-        self.nominal_chips = 111
-        self.fan_count = 2
+    model = "M30S++ VG30"
+    nominal_chips = 111
+    fan_count = 2
 
 
 class M30SPlusPlusVG40(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M30S++ VG40"
-        self.nominal_chips = 117
-        self.fan_count = 2
+    model = "M30S++ VG40"
+    nominal_chips = 117
+    fan_count = 2
 
 
 class M30SPlusPlusVH60(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M30S++ VH60"
-        self.nominal_chips = 78
-        self.fan_count = 2
+    model = "M30S++ VH60"
+    nominal_chips = 78
+    fan_count = 2
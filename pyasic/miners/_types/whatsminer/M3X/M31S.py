@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class M31S(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M31S"
-        # TODO: Add chip count for this miner (per board) - self.nominal_chips
-        self.fan_count = 2
+    model = "M31S"
+    # TODO: Add chip count for this miner (per board) - nominal_chips
+    fan_count = 2
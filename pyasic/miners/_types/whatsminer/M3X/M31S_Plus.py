@@ -16,63 +16,42 @@ from pyasic.miners.base import BaseMiner
 
 
 class M31SPlus(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M31S+"
-        self.nominal_chips = 78
-        self.fan_count = 2
+    model = "M31S+"
+    nominal_chips = 78
+    fan_count = 2
 
 
 class M31SPlusVE20(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M31S+ VE20"
-        self.nominal_chips = 78
-        self.fan_count = 2
+    model = "M31S+ VE20"
+    nominal_chips = 78
+    fan_count = 2
 
 
 class M31SPlusV30(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M31S+ V30"
-        self.nominal_chips = 117
-        self.fan_count = 2
+    model = "M31S+ V30"
+    nominal_chips = 117
+    fan_count = 2
 
 
 class M31SPlusV40(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M31S+ V40"
-        self.nominal_chips = 123
-        self.fan_count = 2
+    model = "M31S+ V40"
+    nominal_chips = 123
+    fan_count = 2
 
 
 class M31SPlusV60(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M31S+ V60"
-        self.nominal_chips = 156
-        self.fan_count = 2
+    model = "M31S+ V60"
+    nominal_chips = 156
+    fan_count = 2
 
 
 class M31SPlusV80(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M31S+ V80"
-        self.nominal_chips = 129
-        self.fan_count = 2
+    model = "M31S+ V80"
+    nominal_chips = 129
+    fan_count = 2
 
 
 class M31SPlusV90(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M31S+ V90"
-        self.nominal_chips = 117
-        self.fan_count = 2
+    model = "M31S+ V90"
+    nominal_chips = 117
+    fan_count = 2
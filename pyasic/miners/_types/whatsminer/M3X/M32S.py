@@ -16,9 +16,6 @@ from pyasic.miners.base import BaseMiner
 
 
 class M32S(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M32S"
-        self.nominal_chips = 78
-        self.fan_count = 2
+    model = "M32S"
+    nominal_chips = 78
+    fan_count = 2
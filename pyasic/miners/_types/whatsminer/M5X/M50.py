@@ -16,18 +16,12 @@ from pyasic.miners.base import BaseMiner
 
 
 class M50(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M50"
-        self.nominal_chips = 105
-        self.fan_count = 2
+    model = "M50"
+    nominal_chips = 105
+    fan_count = 2
 
 
 class M50VH50(BaseMiner):
-    def __init__(self, ip: str):
-        super().__init__()
-        self.ip = ip
-        self.model = "M50 VH50"
-        self.nominal_chips = 105
-        self.fan_count = 2
+    model = "M50 VH50"
+    nominal_chips = 105
+    fan_count = 2
@@ -30,18 +30,20 @@ from pyasic.data.error_codes import (
 
 
 class BaseMiner(ABC):
+    # static details of the miner type, set on the class by each type in `pyasic.miners._types`
+    model = None
+    nominal_chips = 1
+    fan_count = 2
+
     def __init__(self, *args) -> None:
         self.ip = None
         self.uname = "root"
         self.pwd = "admin"
         self.api = None
         self.api_type = None
-        self.model = None
         self.light = None
         self.hostname = None
-        self.nominal_chips = 1
         self.version = None
-        self.fan_count = 2
         self.config = None
 
     def __new__(cls, *args, **kwargs):
@@ -61,7 +63,7 @@ class BaseMiner(ABC):
     def __eq__(self, other):
         return ipaddress.ip_address(self.ip) == ipaddress.ip_address(other.ip)
 
-    async def _get_ssh_connection(self) -> asyncssh.connect:
+    async def _get_ssh_connection(self, client_factory=None) -> asyncssh.connect:
         """Create a new asyncssh connection"""
         try:
             conn = await asyncssh.connect(
@@ -70,6 +72,7 @@ class BaseMiner(ABC):
                 username=self.uname,
                 password=self.pwd,
                 server_host_key_algs=["ssh-rsa"],
+                client_factory=client_factory,
             )
             return conn
         except asyncssh.misc.PermissionDenied:
@@ -80,6 +83,7 @@ class BaseMiner(ABC):
                     username="root",
                     password="admin",
                     server_host_key_algs=["ssh-rsa"],
+                    client_factory=client_factory,
                 )
                 return conn
             except Exception as e:
@@ -32,13 +32,13 @@ from pyasic.miners._backends.bosminer_old import (  # noqa - Ignore _module impo
 
 from pyasic.miners.unknown import UnknownMiner
 
+from pyasic.API import BaseMinerAPI
 from pyasic.errors import APIError
 
 from pyasic.misc import Singleton
 
 import asyncio
 import ipaddress
-import json
 import logging
 
 from pyasic.settings import PyasicSettings
@@ -302,6 +302,27 @@ class MinerFactory(metaclass=Singleton):
         for miner in scanned:
             yield await miner
 
+    async def get_miners(
+        self, ips: List[Union[ipaddress.ip_address, str]], max_inflight: int = 64
+    ) -> List[AnyMiner]:
+        """
+        Get Miner objects from ip addresses, keeping a limited number of lookups in flight at once.
+
+        Parameters:
+            ips: a list of ip addresses to get miners for.
+            max_inflight: the maximum number of miners to identify concurrently.
+
+        Returns:
+            A list of miners, in the same order as the ip addresses passed in.
+        """
+        semaphore = asyncio.Semaphore(max_inflight)
+
+        async def _get_miner(ip: Union[ipaddress.ip_address, str]) -> AnyMiner:
+            async with semaphore:
+                return await self.get_miner(ip)
+
+        return list(await asyncio.gather(*[_get_miner(ip) for ip in ips]))
+
     async def get_miner(self, ip: Union[ipaddress.ip_address, str]) -> AnyMiner:
         """Decide a miner type using the IP address of the miner.
 
@@ -631,14 +652,15 @@ class MinerFactory(metaclass=Singleton):
             return False, "No API data."
         # if status isn't a key, it is a multicommand
         if "STATUS" not in data.keys():
-            for key in data.keys():
+            for key, entries in data.items():
                 # make sure not to try to turn id into a dict
-                if not key == "id":
-                    # make sure they succeeded
-                    if "STATUS" in data[key][0].keys():
-                        if data[key][0]["STATUS"][0]["STATUS"] not in ["S", "I"]:
-                            # this is an error
-                            return False, f"{key}: " + data[key][0]["STATUS"][0]["Msg"]
+                if key == "id":
+                    continue
+                # make sure they succeeded
+                status = entries[0].get("STATUS")
+                if status and status[0].get("STATUS") not in ("S", "I"):
+                    # this is an error
+                    return False, f"{key}: " + status[0]["Msg"]
         elif "id" not in data.keys():
             if data["STATUS"] not in ["S", "I"]:
                 return False, data["Msg"]
@@ -660,49 +682,21 @@ class MinerFactory(metaclass=Singleton):
                 raise e
             logging.warning(f"{str(ip)} - Command {command}: {e}")
             return {}
-        # create the command
-        cmd = {"command": command}
-
-        # send the command
-        writer.write(json.dumps(cmd).encode("utf-8"))
-        await writer.drain()
-
-        # instantiate data
-        data = b""
-
-        # loop to receive all the data
-        try:
-            while True:
-                d = await reader.read(4096)
-                if not d:
-                    break
-                data += d
-        except Exception as e:
-            logging.debug(f"{str(ip)}: {e}")
+        # send the command and get the reply
+        data = await BaseMinerAPI._send_and_receive(
+            reader,
+            writer,
+            BaseMinerAPI._create_command(command),
+            str(ip),
+            # failed reads are expected while probing unknown miners
+            log_level=logging.DEBUG,
+        )
 
         try:
-            # some json from the API returns with a null byte (\x00) on the end
-            if data.endswith(b"\x00"):
-                # handle the null byte
-                str_data = data.decode("utf-8")[:-1]
-            else:
-                # no null byte
-                str_data = data.decode("utf-8")
-            # fix an error with a btminer return having an extra comma that breaks json.loads()
-            str_data = str_data.replace(",}", "}")
-            # fix an error with a btminer return having a newline that breaks json.loads()
-            str_data = str_data.replace("\n", "")
-            # fix an error with a bmminer return missing a specific comma that breaks json.loads()
-            str_data = str_data.replace("}{", "},{")
-            # parse the json
-            data = json.loads(str_data)
+            # parse the raw bytes with the same fix-ups the API uses
+            data = BaseMinerAPI._load_api_data(data)
         # handle bad json
-        except json.decoder.JSONDecodeError:
-            # raise APIError(f"Decode Error: {data}")
+        except APIError:
             data = None
 
-        # close the connection
-        writer.close()
-        await writer.wait_closed()
-
         return data
@@ -12,6 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import copy
+import functools
+import time
+
 
 class Singleton(type):
     _instances = {}
@@ -20,3 +24,30 @@ class Singleton(type):
         if cls not in cls._instances:
             cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
         return cls._instances[cls]
+
+
+def async_ttl_cache(seconds: float):
+    """Cache the result of an async method on its instance for a number of seconds.
+
+    Each caller gets its own copy of the cached result, so changing it does not
+    affect the cache.
+
+    Parameters:
+        seconds: How long a result stays valid before the method is called again.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache = self.__dict__.setdefault("_ttl_cache", {})
+            key = (func.__name__, args, tuple(kwargs.items()))
+            now = time.monotonic()
+            if key in cache and now - cache[key][0] < seconds:
+                return copy.deepcopy(cache[key][1])
+            data = await func(self, *args, **kwargs)
+            cache[key] = (now, data)
+            return copy.deepcopy(data)
+
+        return wrapper
+
+    return decorator
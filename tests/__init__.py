@@ -16,6 +16,7 @@ import unittest
 from tests.miners_tests import MinersTest, MinerFactoryTest
 from tests.network_tests import NetworkTest
 from tests.config_tests import ConfigTest
+from tests.api_tests import APITest
 
 if __name__ == "__main__":
     # `coverage run --source pyasic -m unittest discover` will give code coverage data
@@ -0,0 +1,252 @@
+#  Copyright 2022 Upstream Data Inc
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+import json
+import unittest
+
+from pyasic.API import BaseMinerAPI
+from pyasic.API.bosminer import BOSMinerAPI
+from pyasic.API.cgminer import CGMinerAPI
+from pyasic.errors import APIError, APIWarning
+
+
+class APITest(unittest.TestCase):
+    def test_load_api_data(self):
+        test_data = [
+            (
+                b'{"STATUS":[{"STATUS":"S"}],"id":1}\x00',
+                {"STATUS": [{"STATUS": "S"}], "id": 1},
+            ),
+            (
+                b'{"SUMMARY":[{"Elapsed":1,}],"id":1}',
+                {"SUMMARY": [{"Elapsed": 1}], "id": 1},
+            ),
+            (b'{"STATS":[{"a":1}{"b":2}]}', {"STATS": [{"a": 1}, {"b": 2}]}),
+            (b'{"STATS":[,{"a":1}]}', {"STATS": [{"a": 1}]}),
+            (b'{"MM":[{"Temp":inf,"Fan":nan}]}', {"MM": [{"Temp": 0, "Fan": 0}]}),
+            (b',"id":1}', {"id": 1}),
+            (b'{"STATS":[{"a":1,}{"b":2}]}', {"STATS": [{"a": 1}, {"b": 2}]}),
+            (b'{"STATS":[{"a":1}\n{"b":2}]}', {"STATS": [{"a": 1}, {"b": 2}]}),
+            (b'{"Msg":"line\nbreak"}', {"Msg": "linebreak"}),
+            (b'{"Msg":"info"}', {"Msg": "info"}),
+            (b'{"a":1,"b":2,"c":"trunc', {"a": 1, "b": 2}),
+        ]
+        for raw, expected in test_data:
+            with self.subTest(raw=raw):
+                self.assertDictEqual(BaseMinerAPI._load_api_data(raw), expected)
+
+        with self.assertRaises(APIError):
+            BaseMinerAPI._load_api_data(b"not json}")
+
+    def test_validate_command_output(self):
+        bad_test_data_returns = [
+            {
+                "cmd": [
+                    {
+                        "STATUS": [
+                            {"STATUS": "E", "Msg": "Command failed for some reason."}
+                        ]
+                    }
+                ]
+            },
+            {"STATUS": "E", "Msg": "Command failed for some reason."},
+            {
+                "STATUS": [{"STATUS": "E", "Msg": "Command failed for some reason."}],
+                "id": 1,
+            },
+        ]
+        for data in bad_test_data_returns:
+            with self.subTest(data=data):
+                self.assertFalse(BaseMinerAPI._validate_command_output(data)[0])
+
+        good_test_data_returns = [
+            {
+                "cmd": [{"STATUS": [{"STATUS": "S", "Msg": "Yay!"}]}],
+                "cmd2": [{"STATUS": [{"STATUS": "I", "Msg": "Info"}]}],
+                "id": 1,
+            },
+            {"STATUS": "S", "Msg": "Yay! Command succeeded."},
+            {"STATUS": "RESTART", "id": 1},
+            {
+                "STATUS": [{"STATUS": "S", "Msg": "Yay! Command succeeded."}],
+                "id": 1,
+            },
+        ]
+        for data in good_test_data_returns:
+            with self.subTest(data=data):
+                self.assertTrue(BaseMinerAPI._validate_command_output(data)[0])
+
+    def test_create_command(self):
+        self.assertEqual(
+            BaseMinerAPI._create_command("summary"),
+            json.dumps({"command": "summary"}).encode("utf-8"),
+        )
+        self.assertEqual(
+            BaseMinerAPI._create_command("devdetails+version"),
+            json.dumps({"command": "devdetails+version"}).encode("utf-8"),
+        )
+        for command, parameters in [("asc", 1), ('bad"name', None), ("pools", "0,1")]:
+            with self.subTest(command=command, parameters=parameters):
+                expected = {"command": command}
+                if parameters:
+                    expected["parameter"] = parameters
+                self.assertDictEqual(
+                    json.loads(BaseMinerAPI._create_command(command, parameters)),
+                    expected,
+                )
+
+    def test_check_commands(self):
+        api = CGMinerAPI("0.0.0.0")
+        self.assertListEqual(
+            api._check_commands("summary", "pools"), ["summary", "pools"]
+        )
+        with self.assertWarns(APIWarning):
+            commands = api._check_commands("summary", "fake_command", "pools")
+        self.assertListEqual(commands, ["summary", "pools"])
+
+    def test_build_multicommand(self):
+        api = CGMinerAPI("0.0.0.0")
+        self.assertEqual(api._build_multicommand(("summary", "pools")), "summary+pools")
+        # the warning is only raised when the result isn't cached yet
+        BaseMinerAPI._build_multicommand.cache_clear()
+        with self.assertWarns(APIWarning):
+            command = BOSMinerAPI._build_multicommand(("summary", "fake_command"))
+        self.assertEqual(command, "summary")
+
+    def test_keepalive(self):
+        reply = b'{"STATUS":[{"STATUS":"S","Msg":"Summary"}],"SUMMARY":[],"id":1}\x00'
+
+        async def _coro(close_after_reply: bool):
+            connections = []
+
+            async def _handle(reader, writer):
+                connections.append(writer)
+                while await reader.read(4096):
+                    writer.write(reply)
+                    await writer.drain()
+                    if close_after_reply:
+                        break
+                writer.close()
+
+            server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            api = CGMinerAPI("127.0.0.1", port)
+            api.keepalive = True
+            results = [await api.summary() for _ in range(3)]
+            await api.close()
+            server.close()
+            await server.wait_closed()
+            return results, len(connections)
+
+        for close_after_reply, connection_count in [(False, 1), (True, 3)]:
+            with self.subTest(close_after_reply=close_after_reply):
+                results, connections = asyncio.run(_coro(close_after_reply))
+                for result in results:
+                    self.assertEqual(result["STATUS"][0]["Msg"], "Summary")
+                self.assertEqual(connections, connection_count)
+
+    def test_keepalive_timeout(self):
+        reply = b'{"STATUS":[{"STATUS":"S","Msg":"Summary"}],"SUMMARY":[],"id":1}'
+
+        async def _coro():
+            connections = []
+
+            async def _handle(reader, writer):
+                connections.append(writer)
+                # reply without a null byte, and only close after sitting idle
+                try:
+                    while await asyncio.wait_for(reader.read(4096), timeout=0.3):
+                        writer.write(reply)
+                        await writer.drain()
+                except asyncio.TimeoutError:
+                    pass
+                writer.close()
+
+            server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            api = CGMinerAPI("127.0.0.1", port)
+            api.keepalive = True
+            api.keepalive_timeout = 0.1
+            result = await api.summary()
+            server.close()
+            await server.wait_closed()
+            return result, len(connections), api.keepalive
+
+        result, connections, keepalive = asyncio.run(_coro())
+        self.assertEqual(result["STATUS"][0]["Msg"], "Summary")
+        # the timed out reply is sent again on a connection of its own
+        self.assertEqual(connections, 2)
+        self.assertTrue(keepalive)
+
+    def test_keepalive_cancelled(self):
+        async def _coro():
+            async def _handle(reader, writer):
+                while data := await reader.read(4096):
+                    command = json.loads(data)["command"]
+                    if command == "summary":
+                        await asyncio.sleep(0.3)
+                    writer.write(
+                        b'{"STATUS":[{"STATUS":"S","Msg":"%s"}],"id":1}\x00'
+                        % command.encode()
+                    )
+                    await writer.drain()
+                writer.close()
+
+            server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            api = CGMinerAPI("127.0.0.1", port)
+            api.keepalive = True
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(api.summary(), 0.1)
+            result = await api.pools()
+            await api.close()
+            server.close()
+            await server.wait_closed()
+            return result
+
+        result = asyncio.run(_coro())
+        # the reply to the cancelled command must not be read as this one
+        self.assertEqual(result["STATUS"][0]["Msg"], "pools")
+
+    def test_bosminer_devdetails_cache(self):
+        reply = b'{"STATUS":[{"STATUS":"S","Msg":"Devs"}],"DEVDETAILS":[],"id":1}\x00'
+
+        async def _coro():
+            connections = []
+
+            async def _handle(reader, writer):
+                connections.append(writer)
+                await reader.read(4096)
+                writer.write(reply)
+                await writer.drain()
+                writer.close()
+
+            server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            api = BOSMinerAPI("127.0.0.1", port)
+            results = [await api.devdetails()]
+            # changing a returned result must not leak into the cached copy
+            results[0]["DEVDETAILS"].append({})
+            results.append(await api.devdetails())
+            server.close()
+            await server.wait_closed()
+            return results, len(connections)
+
+        results, connections = asyncio.run(_coro())
+        self.assertEqual(results[1]["DEVDETAILS"], [])
+        self.assertEqual(connections, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
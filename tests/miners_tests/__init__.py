@@ -87,6 +87,31 @@ class MinerFactoryTest(unittest.TestCase):
         _miners = asyncio.run(_coro())
         self.assertListEqual(_miners, [])
 
+    def test_get_miners(self):
+        _miners = asyncio.run(MinerFactory().get_miners([]))
+        self.assertListEqual(_miners, [])
+
+        factory = MinerFactory()
+        ips = [f"192.168.1.{i}" for i in range(1, 21)]
+        inflight = {"current": 0, "peak": 0}
+
+        async def _get_miner(ip):
+            inflight["current"] += 1
+            inflight["peak"] = max(inflight["peak"], inflight["current"])
+            # earlier ips finish last, so the results only stay in order if get_miners orders them
+            await asyncio.sleep(0.001 * (len(ips) - ips.index(ip)))
+            inflight["current"] -= 1
+            return ip
+
+        factory.get_miner = _get_miner
+        try:
+            _miners = asyncio.run(factory.get_miners(ips, max_inflight=5))
+        finally:
+            del factory.get_miner
+        self.assertGreater(inflight["peak"], 1)
+        self.assertLessEqual(inflight["peak"], 5)
+        self.assertListEqual(_miners, ips)
+
     def test_miner_selection(self):
         for miner_model in MINER_CLASSES.keys():
             with self.subTest():